@@ -3,26 +3,66 @@
 from __future__ import annotations
 
 import asyncio
+import gzip
+import hashlib
 import json
 import logging
 import os
 import time
-import webbrowser
-from dataclasses import dataclass
-from datetime import datetime
+from collections import deque
+from dataclasses import dataclass, field
+from itertools import islice
 from pathlib import Path
 from typing import Any
 
 from aiohttp import WSMsgType, web
 
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+    # Fragment (raw pre-serialized JSON splicing) arrived in orjson 3.9.10
+    _Fragment = getattr(orjson, "Fragment", None)
+except ImportError:  # pragma: no cover - exercised only without the optional dep
+    orjson = None
+    _Fragment = None
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
 logger = logging.getLogger(__name__)
 
+# Message types where only the latest value matters; intermediate updates
+# queued in the same flush are conflated away
+_COALESCABLE_TYPES = frozenset({"device_info", "wda_status"})
+
+# Constant envelope for init frames; the state payload is spliced in as bytes
+_INIT_PREFIX = b'{"type":"init","data":'
+
 # Dashboard configuration (can be overridden via environment variables)
 DASHBOARD_PORT = int(os.environ.get("DASHBOARD_PORT", "8200"))
+DASHBOARD_BIND = os.environ.get("DASHBOARD_BIND", "127.0.0.1")
 DASHBOARD_AUTO_OPEN = os.environ.get("DASHBOARD_AUTO_OPEN", "true").lower() in ("true", "1", "yes")
 
 
-@dataclass
+# Calls landing within the same wall-clock second share one formatted string
+_last_sec = -1
+_last_sec_str = ""
+
+
+def _format_time(timestamp: float) -> str:
+    global _last_sec, _last_sec_str
+    sec = int(timestamp)
+    if sec != _last_sec:
+        lt = time.localtime(sec)
+        _last_sec = sec
+        _last_sec_str = f"{lt.tm_hour:02d}:{lt.tm_min:02d}:{lt.tm_sec:02d}"
+    return _last_sec_str
+
+
+@dataclass(slots=True)
 class ToolCall:
     """Represents a single tool call."""
 
@@ -30,23 +70,70 @@ class ToolCall:
     timestamp: float
     tool_name: str
     arguments: dict[str, Any]
+    # Monotonic start time for duration math; `timestamp` stays wall-clock
+    # for display but can step under NTP adjustments
+    mono_start: float = field(default_factory=time.monotonic)
     status: str = "pending"  # pending, success, error
     result: str | None = None
     error: str | None = None
     duration_ms: float | None = None
+    time_str: str = ""
+    # Memoized to_dict() output; cleared when the call mutates
+    _cached_dict: dict[str, Any] | None = field(default=None, repr=False)
+    # Arguments pre-serialized once at creation (orjson only); broadcasts
+    # then splice the raw fragment instead of re-walking the dict
+    _arguments_json: bytes | None = field(default=None, repr=False)
+
+    def __post_init__(self):
+        if not self.time_str:
+            self.time_str = _format_time(self.timestamp)
+        if _Fragment is not None and self._arguments_json is None:
+            try:
+                self._arguments_json = orjson.dumps(self.arguments)
+            except TypeError:
+                self._arguments_json = None
+
+    def invalidate(self) -> None:
+        """Drop the memoized dict after a field mutation."""
+        self._cached_dict = None
 
     def to_dict(self) -> dict[str, Any]:
-        return {
+        if self._cached_dict is not None:
+            return self._cached_dict
+        self._cached_dict = {
             "id": self.id,
             "timestamp": self.timestamp,
-            "time_str": datetime.fromtimestamp(self.timestamp).strftime("%H:%M:%S"),
+            "time_str": self.time_str,
             "tool_name": self.tool_name,
-            "arguments": self.arguments,
+            "arguments": (
+                _Fragment(self._arguments_json)
+                if self._arguments_json is not None
+                else self.arguments
+            ),
             "status": self.status,
             "result": self.result[:500] if self.result and len(self.result) > 500 else self.result,
             "error": self.error,
             "duration_ms": self.duration_ms,
         }
+        return self._cached_dict
+
+    def to_delta(self) -> dict[str, Any]:
+        """Compact completion payload: only fields that changed since add.
+
+        Clients already hold the full record from the tool_call broadcast,
+        so resending arguments/timestamps roughly doubles the bytes on the
+        wire for no information.
+        """
+        delta: dict[str, Any] = {
+            "id": self.id,
+            "status": self.status,
+            "duration_ms": self.duration_ms,
+        }
+        if self.result is not None:
+            delta["result"] = self.result[:500] if len(self.result) > 500 else self.result
+        if self.error is not None:
+            delta["error"] = self.error
+        return delta
 
 
 class DashboardState:
@@ -54,19 +141,43 @@ class DashboardState:
 
     def __init__(self, max_calls: int = 100):
         self.max_calls = max_calls
-        self.tool_calls: list[ToolCall] = []
+        # Bounded deque drops the oldest entry in O(1); no slice-copies
+        self.tool_calls: deque[ToolCall] = deque(maxlen=max_calls)
         self.call_counter = 0
-        self.websockets: set[web.WebSocketResponse] = set()
+        # One bounded outbound queue per client, drained by a dedicated
+        # writer task, so a stalled client only loses its own frames
+        self.client_queues: dict[web.WebSocketResponse, asyncio.Queue[bytes]] = {}
+        self._writer_tasks: dict[web.WebSocketResponse, asyncio.Task] = {}
         self.server_start_time = time.time()
         self.device_info: dict[str, Any] = {}
         self.wda_status: dict[str, Any] = {}
         self.last_screenshot: str | None = None
+        self.last_screenshot_etag: str | None = None
+        self.screenshot_version: int = 0
         self.recording_active: bool = False
         # Callback for executing tools from the dashboard
         self.tool_executor: Any = None  # Will be set by server.py
+        # State cache: bumped on every mutation so get_state() can be memoized
+        self._state_version = 0
+        self._cached_state: dict[str, Any] | None = None
+        self._cached_state_version = -1
+        self._cached_state_bytes: bytes | None = None
+        self._cached_state_bytes_version = -1
+        self._cached_init_bytes: bytes | None = None
+        self._cached_init_bytes_version = -1
+        # Outgoing messages are coalesced by a single broadcaster task so
+        # bursty tool activity produces one WS frame per flush, not per event
+        self._pending: deque[dict[str, Any]] = deque()
+        self._flush_event = asyncio.Event()
+        self._broadcaster_task: asyncio.Task | None = None
+
+    def _mark_dirty(self) -> None:
+        """Invalidate cached state after a mutation."""
+        self._state_version += 1
 
     def add_tool_call(self, tool_name: str, arguments: dict[str, Any]) -> ToolCall:
         """Add a new tool call and return it."""
+        self._mark_dirty()
         self.call_counter += 1
         call = ToolCall(
             id=self.call_counter,
@@ -76,15 +187,11 @@ class DashboardState:
         )
         self.tool_calls.append(call)
 
-        # Trim old calls
-        if len(self.tool_calls) > self.max_calls:
-            self.tool_calls = self.tool_calls[-self.max_calls:]
-
         # Broadcast to websockets
-        asyncio.create_task(self._broadcast({
+        self._enqueue({
             "type": "tool_call",
             "data": call.to_dict(),
-        }))
+        })
 
         return call
 
@@ -95,7 +202,9 @@ class DashboardState:
         error: str | None = None,
     ):
         """Mark a tool call as complete."""
-        call.duration_ms = (time.time() - call.timestamp) * 1000
+        self._mark_dirty()
+        call.invalidate()
+        call.duration_ms = (time.monotonic() - call.mono_start) * 1000
         if error:
             call.status = "error"
             call.error = error
@@ -105,10 +214,19 @@ class DashboardState:
 
         # Track screenshots
         if call.tool_name == "get_screenshot" and result:
-            for line in result.split("\n"):
-                if line.startswith("Screenshot saved:"):
-                    self.last_screenshot = line.split(": ", 1)[1].strip()
-                    break
+            # Single find instead of splitting the whole result into lines
+            marker = "Screenshot saved: "
+            i = result.find(marker)
+            if i >= 0:
+                j = result.find("\n", i)
+                self.last_screenshot = result[i + len(marker):j if j > 0 else None].strip()
+                if self._refresh_screenshot_etag():
+                    # Clients swap the <img> src only when the version advances,
+                    # so unchanged frames never trigger a refetch
+                    self._enqueue({
+                        "type": "screenshot",
+                        "data": {"version": self.screenshot_version},
+                    })
 
         # Track recording
         if call.tool_name == "start_recording" and call.status == "success":
@@ -116,55 +234,212 @@ class DashboardState:
         elif call.tool_name == "stop_recording" and call.status == "success":
             self.recording_active = False
 
-        # Broadcast update
-        asyncio.create_task(self._broadcast({
+        # Broadcast update (delta only; clients merge by id)
+        self._enqueue({
             "type": "tool_complete",
-            "data": call.to_dict(),
-        }))
+            "data": call.to_delta(),
+        })
 
     def update_device_info(self, info: dict[str, Any]):
         """Update device info."""
+        if info == self.device_info:
+            return
+        self._mark_dirty()
         self.device_info = info
-        asyncio.create_task(self._broadcast({
+        self._enqueue({
             "type": "device_info",
             "data": info,
-        }))
+        })
 
     def update_wda_status(self, status: dict[str, Any]):
         """Update WDA status."""
+        if status == self.wda_status:
+            return
+        self._mark_dirty()
         self.wda_status = status
-        asyncio.create_task(self._broadcast({
+        self._enqueue({
             "type": "wda_status",
             "data": status,
-        }))
+        })
 
-    async def _broadcast(self, message: dict[str, Any]):
-        """Broadcast message to all connected websockets."""
-        if not self.websockets:
+    def _refresh_screenshot_etag(self) -> bool:
+        """Derive a weak ETag from the screenshot file's mtime and size.
+
+        Returns True when the frame actually changed (bumping screenshot_version).
+        """
+        previous = self.last_screenshot_etag
+        try:
+            st = os.stat(self.last_screenshot)
+            self.last_screenshot_etag = f'W/"{st.st_mtime_ns:x}-{st.st_size:x}"'
+        except OSError:
+            self.last_screenshot_etag = None
+            return False
+        if self.last_screenshot_etag != previous:
+            self.screenshot_version += 1
+            return True
+        return False
+
+    def _enqueue(self, message: dict[str, Any]) -> None:
+        """Queue a message for broadcast and wake the broadcaster task.
+
+        Appending to a deque and setting an event is synchronous and
+        allocation-light, unlike scheduling one asyncio task per event.
+        """
+        if not self.client_queues:
+            # Nobody is watching: skip the queue/wakeup/encode entirely.
+            # New clients get the full picture from the init snapshot.
             return
+        self._pending.append(message)
+        self._flush_event.set()
+        if self._broadcaster_task is None or self._broadcaster_task.done():
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                # No loop yet (e.g. unit tests constructing state directly);
+                # messages stay queued until one exists.
+                return
+            self._broadcaster_task = loop.create_task(self._broadcast_loop())
+
+    async def _broadcast_loop(self) -> None:
+        """Drain pending messages and broadcast them as one batched frame."""
+        while True:
+            await self._flush_event.wait()
+            # Short absorb window so a burst of events (tool call + complete
+            # + screenshot update) lands in one frame instead of several
+            await asyncio.sleep(0.01)
+            self._flush_event.clear()
+
+            events: list[dict[str, Any]] = []
+            latest_idx: dict[str, int] = {}
+            while self._pending:
+                message = self._pending.popleft()
+                mtype = message.get("type")
+                if mtype in _COALESCABLE_TYPES:
+                    if mtype in latest_idx:
+                        # Supersede the stale update in place
+                        events[latest_idx[mtype]] = message
+                        continue
+                    latest_idx[mtype] = len(events)
+                events.append(message)
+            if not events:
+                continue
+
+            if len(events) == 1:
+                self._broadcast(events[0])
+            else:
+                self._broadcast({"type": "batch", "events": events})
+
+    def register_client(self, ws: web.WebSocketResponse) -> asyncio.Queue[bytes]:
+        """Attach a websocket client with its own bounded outbound queue."""
+        queue: asyncio.Queue[bytes] = asyncio.Queue(maxsize=64)
+        self.client_queues[ws] = queue
+        self._writer_tasks[ws] = asyncio.get_running_loop().create_task(
+            self._client_writer(ws, queue)
+        )
+        return queue
 
-        msg_str = json.dumps(message)
-        dead_ws = set()
+    def unregister_client(self, ws: web.WebSocketResponse) -> None:
+        """Detach a client and stop its writer task."""
+        self.client_queues.pop(ws, None)
+        task = self._writer_tasks.pop(ws, None)
+        if task is not None:
+            task.cancel()
 
-        for ws in self.websockets:
-            try:
-                await ws.send_str(msg_str)
-            except Exception:
-                dead_ws.add(ws)
+    async def _client_writer(self, ws: web.WebSocketResponse, queue: asyncio.Queue[bytes]):
+        """Drain one client's queue; a slow or dead client only hurts itself."""
+        try:
+            while True:
+                payload = await queue.get()
+                await ws.send_bytes(payload)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.client_queues.pop(ws, None)
+            self._writer_tasks.pop(ws, None)
+
+    def _broadcast(self, message: dict[str, Any]) -> None:
+        """Broadcast message to all connected websockets."""
+        if not self.client_queues:
+            return
 
-        self.websockets -= dead_ws
+        payload = _dumps(message)
+        for queue in list(self.client_queues.values()):
+            try:
+                queue.put_nowait(payload)
+            except asyncio.QueueFull:
+                # Slow client: evict its oldest frame so it keeps receiving
+                # the freshest state instead of an ever-staler backlog
+                try:
+                    queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    pass
+                try:
+                    queue.put_nowait(payload)
+                except asyncio.QueueFull:
+                    pass
 
     def get_state(self) -> dict[str, Any]:
-        """Get current state for initial load."""
-        return {
+        """Get current state for initial load.
+
+        The composed dict is memoized against the state version so that
+        concurrent clients (WS init, /api/state polls) share one build
+        instead of re-rendering up to 50 `to_dict` calls each.
+        """
+        if self._cached_state is not None and self._cached_state_version == self._state_version:
+            # Only uptime drifts between mutations; refresh it in place
+            self._cached_state["uptime"] = time.time() - self.server_start_time
+            return self._cached_state
+
+        self._cached_state = {
             "uptime": time.time() - self.server_start_time,
-            "tool_calls": [c.to_dict() for c in self.tool_calls[-50:]],
+            "tool_calls": [
+                c.to_dict()
+                for c in islice(self.tool_calls, max(0, len(self.tool_calls) - 50), None)
+            ],
             "device_info": self.device_info,
             "wda_status": self.wda_status,
             "last_screenshot": self.last_screenshot,
+            "screenshot_version": self.screenshot_version,
             "recording_active": self.recording_active,
             "total_calls": self.call_counter,
         }
+        self._cached_state_version = self._state_version
+        return self._cached_state
+
+    def get_state_bytes(self) -> bytes:
+        """Serialized get_state(), cached until the next mutation.
+
+        Bursts of /api/state polls between mutations collapse to a single
+        encode. Uptime is pinned to the last rebuild, which is fine for the
+        dashboard (it tracks uptime client-side after init).
+        """
+        if (
+            self._cached_state_bytes is not None
+            and self._cached_state_bytes_version == self._state_version
+        ):
+            return self._cached_state_bytes
+        self._cached_state_bytes = _dumps(self.get_state())
+        self._cached_state_bytes_version = self._state_version
+        return self._cached_state_bytes
+
+    def get_state_etag(self) -> str:
+        """Monotonic ETag for conditional /api/state requests."""
+        return f'"v{self._state_version}"'
+
+    def get_init_bytes(self) -> bytes:
+        """Pre-encoded init message shared by all connecting clients.
+
+        Splices the cached /api/state bytes into a constant envelope, so the
+        state snapshot is serialized once no matter how clients ask for it.
+        """
+        if (
+            self._cached_init_bytes is not None
+            and self._cached_init_bytes_version == self._state_version
+        ):
+            return self._cached_init_bytes
+        self._cached_init_bytes = _INIT_PREFIX + self.get_state_bytes() + b"}"
+        self._cached_init_bytes_version = self._state_version
+        return self._cached_init_bytes
 
 
 # Global dashboard state
@@ -179,22 +454,57 @@ def _load_template() -> str:
     template_path = TEMPLATE_DIR / "dashboard.html"
     return template_path.read_text()
 
-# Cache the template (loaded once at import time)
-DASHBOARD_HTML = _load_template()
+# The dashboard JS lives in its own file and is served at a content-hashed
+# URL, so browsers cache it forever and refetch only when it actually changes
+_JS_BYTES = (TEMPLATE_DIR / "dashboard.js").read_bytes()
+_JS_GZ = gzip.compress(_JS_BYTES, 9)
+_JS_HASH = hashlib.md5(_JS_BYTES).hexdigest()[:12]
 
+# Cache the template (loaded once at import time), precompressed so every
+# page load serves static bytes instead of re-encoding/compressing
+DASHBOARD_HTML = _load_template().replace("__JS_HASH__", _JS_HASH)
+_HTML_BYTES = DASHBOARD_HTML.encode("utf-8")
+_HTML_GZ = gzip.compress(_HTML_BYTES, 9)
+_HTML_ETAG = f'"{hashlib.md5(_HTML_BYTES).hexdigest()}"'
 
 
 async def handle_index(request: web.Request) -> web.Response:
     """Serve the dashboard HTML."""
-    return web.Response(text=DASHBOARD_HTML, content_type="text/html")
+    headers = {"ETag": _HTML_ETAG, "Cache-Control": "public, max-age=300"}
+    if request.headers.get("If-None-Match") == _HTML_ETAG:
+        return web.Response(status=304, headers=headers)
+    if "gzip" in request.headers.get("Accept-Encoding", ""):
+        headers["Content-Encoding"] = "gzip"
+        return web.Response(body=_HTML_GZ, content_type="text/html", headers=headers)
+    return web.Response(
+        body=_HTML_BYTES, content_type="text/html", charset="utf-8", headers=headers
+    )
+
+
+async def handle_static_js(request: web.Request) -> web.Response:
+    """Serve the dashboard JS. The URL embeds a content hash, so it is immutable."""
+    headers = {"Cache-Control": "public, max-age=31536000, immutable"}
+    if "gzip" in request.headers.get("Accept-Encoding", ""):
+        headers["Content-Encoding"] = "gzip"
+        return web.Response(body=_JS_GZ, content_type="application/javascript", headers=headers)
+    return web.Response(
+        body=_JS_BYTES, content_type="application/javascript", charset="utf-8", headers=headers
+    )
 
 
 async def handle_api_state(request: web.Request) -> web.Response:
     """Return current dashboard state as JSON."""
-    return web.json_response(dashboard_state.get_state())
+    etag = dashboard_state.get_state_etag()
+    if request.headers.get("If-None-Match") == etag:
+        return web.Response(status=304, headers={"ETag": etag})
+    return web.Response(
+        body=dashboard_state.get_state_bytes(),
+        content_type="application/json",
+        headers={"ETag": etag},
+    )
 
 
-async def handle_screenshot(request: web.Request) -> web.Response:
+async def handle_screenshot(request: web.Request) -> web.StreamResponse:
     """Serve the last screenshot."""
     if not dashboard_state.last_screenshot:
         return web.Response(status=404, text="No screenshot available")
@@ -204,7 +514,22 @@ async def handle_screenshot(request: web.Request) -> web.Response:
         return web.Response(status=404, text="Screenshot file not found")
 
     content_type = "image/jpeg" if path.suffix.lower() in [".jpg", ".jpeg"] else "image/png"
-    return web.Response(body=path.read_bytes(), content_type=content_type)
+    # The client requests version-keyed URLs (?v=N), so short-lived caching is safe
+    headers = {"Content-Type": content_type, "Cache-Control": "max-age=60, must-revalidate"}
+    etag = dashboard_state.last_screenshot_etag
+    if etag:
+        headers["ETag"] = etag
+        # Unchanged frames revalidate to a 304 instead of a full download
+        if request.headers.get("If-None-Match") == etag:
+            return web.Response(status=304, headers=headers)
+    # FileResponse streams via sendfile(2) where available, so the image
+    # never has to be materialized in Python memory
+    return web.FileResponse(path, headers=headers)
+
+
+def _json_response(payload: dict, status: int = 200) -> web.Response:
+    """Like web.json_response, but encoded via the module's fast JSON encoder."""
+    return web.Response(body=_dumps(payload), status=status, content_type="application/json")
 
 
 async def handle_action(request: web.Request) -> web.Response:
@@ -215,10 +540,10 @@ async def handle_action(request: web.Request) -> web.Response:
         args = data.get("args", {})
 
         if not tool:
-            return web.json_response({"success": False, "error": "Missing tool name"}, status=400)
+            return _json_response({"success": False, "error": "Missing tool name"}, status=400)
 
         if not dashboard_state.tool_executor:
-            return web.json_response(
+            return _json_response(
                 {"success": False, "error": "Tool executor not configured"},
                 status=503
             )
@@ -226,28 +551,29 @@ async def handle_action(request: web.Request) -> web.Response:
         # Execute the tool via the callback
         try:
             result = await dashboard_state.tool_executor(tool, args)
-            return web.json_response({"success": True, "result": result})
+            return _json_response({"success": True, "result": result})
         except Exception as e:
             logger.error(f"Tool execution failed: {e}")
-            return web.json_response({"success": False, "error": str(e)}, status=500)
+            return _json_response({"success": False, "error": str(e)}, status=500)
 
     except json.JSONDecodeError:
-        return web.json_response({"success": False, "error": "Invalid JSON"}, status=400)
+        return _json_response({"success": False, "error": "Invalid JSON"}, status=400)
 
 
 async def handle_websocket(request: web.Request) -> web.WebSocketResponse:
     """Handle WebSocket connections."""
-    ws = web.WebSocketResponse()
+    # Per-message deflate costs CPU per client per frame; payloads here are
+    # small JSON blobs on localhost, so skip the negotiation entirely.
+    # Clients only ever send tiny control messages, so cap inbound frames
+    # far below aiohttp's 4MB default and let heartbeats reap dead peers.
+    ws = web.WebSocketResponse(compress=False, heartbeat=30, max_msg_size=65536)
     await ws.prepare(request)
 
-    dashboard_state.websockets.add(ws)
-    logger.info(f"WebSocket client connected ({len(dashboard_state.websockets)} total)")
+    dashboard_state.register_client(ws)
+    logger.info(f"WebSocket client connected ({len(dashboard_state.client_queues)} total)")
 
-    # Send initial state
-    await ws.send_json({
-        "type": "init",
-        "data": dashboard_state.get_state(),
-    })
+    # Send initial state (shared pre-encoded payload)
+    await ws.send_bytes(dashboard_state.get_init_bytes())
 
     try:
         async for msg in ws:
@@ -257,8 +583,10 @@ async def handle_websocket(request: web.Request) -> web.WebSocketResponse:
             elif msg.type == WSMsgType.ERROR:
                 logger.error(f"WebSocket error: {ws.exception()}")
     finally:
-        dashboard_state.websockets.discard(ws)
-        logger.info(f"WebSocket client disconnected ({len(dashboard_state.websockets)} remaining)")
+        dashboard_state.unregister_client(ws)
+        logger.info(
+            f"WebSocket client disconnected ({len(dashboard_state.client_queues)} remaining)"
+        )
 
     return ws
 
@@ -267,6 +595,7 @@ def create_dashboard_app() -> web.Application:
     """Create the dashboard web application."""
     app = web.Application()
     app.router.add_get("/", handle_index)
+    app.router.add_get("/static/dashboard.js", handle_static_js)
     app.router.add_get("/api/state", handle_api_state)
     app.router.add_post("/api/action", handle_action)
     app.router.add_get("/screenshot", handle_screenshot)
@@ -277,6 +606,7 @@ def create_dashboard_app() -> web.Application:
 async def start_dashboard(
     port: int = DASHBOARD_PORT,
     auto_open: bool = DASHBOARD_AUTO_OPEN,
+    host: str = DASHBOARD_BIND,
 ) -> web.AppRunner:
     """Start the dashboard server.
 
@@ -284,28 +614,46 @@ async def start_dashboard(
         port: Port to run dashboard on
         auto_open: Whether to auto-open browser.
             Set `DASHBOARD_AUTO_OPEN=false` to disable.
+        host: Address to bind to. Defaults to loopback;
+            set `DASHBOARD_BIND=0.0.0.0` to expose on the network.
     """
     app = create_dashboard_app()
     runner = web.AppRunner(app)
     await runner.setup()
 
-    site = web.TCPSite(runner, "0.0.0.0", port)
+    # reuse_address lets a restarted server rebind immediately instead of
+    # waiting out TIME_WAIT sockets from the previous run
+    site = web.TCPSite(runner, host, port, reuse_address=True)
     await site.start()
 
     url = f"http://localhost:{port}"
     logger.info("Dashboard started at %s", url)
 
-    # Auto-open browser
+    # Auto-open browser (import deferred: webbrowser pulls in subprocess
+    # and platform probing that server startup shouldn't pay for).
+    # webbrowser.open blocks on process spawn, so run it in a worker thread
+    # instead of stalling the event loop during startup.
     if auto_open:
         try:
-            webbrowser.open(url)
-            logger.info("Opened dashboard in browser")
+            import webbrowser
+
+            future = asyncio.get_running_loop().run_in_executor(None, webbrowser.open, url)
+            future.add_done_callback(_log_browser_open)
         except Exception as e:
             logger.warning(f"Could not open browser: {e}")
 
     return runner
 
 
+def _log_browser_open(future: asyncio.Future) -> None:
+    """Report the outcome of the background browser launch."""
+    exc = future.exception()
+    if exc is not None:
+        logger.warning(f"Could not open browser: {exc}")
+    else:
+        logger.info("Opened dashboard in browser")
+
+
 async def stop_dashboard(runner: web.AppRunner) -> None:
     """Stop the dashboard server."""
     await runner.cleanup()
@@ -1307,6 +1307,15 @@ server = mcp
 
 def main():
     """Run the MCP server."""
+    # Optional: uvloop speeds up the asyncio-heavy dashboard/WDA paths.
+    # Must be installed before mcp.run() creates the event loop.
+    try:
+        import uvloop
+
+        uvloop.install()
+        logger.info("Using uvloop event loop")
+    except ImportError:
+        pass
     mcp.run()
 
 
@@ -0,0 +1,569 @@
+// ============ UTILITIES ============
+const $ = id => document.getElementById(id);
+const $$ = sel => document.querySelectorAll(sel);
+const delay = ms => new Promise(r => setTimeout(r, ms));
+
+// ============ STATE ============
+const state = {
+    ws: null,
+    deviceId: null,
+    toolCalls: [],
+    callsById: new Map(),
+    uptimeSeconds: 0,
+    reconnectAttempts: 0,
+    screenshotVersion: -1,
+    windowSize: { width: 393, height: 852 },
+    interactionMode: 'tap',
+    isRecording: false,
+    sequences: JSON.parse(localStorage.getItem('ios-mcp-sequences') || '[]'),
+    seqRecording: { active: false, actions: [] }
+};
+
+// ============ API ============
+const api = {
+    async call(tool, args = {}) {
+        const response = await fetch('/api/action', {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({ tool, args })
+        });
+        return response.json();
+    },
+
+    async callWithDevice(tool, extraArgs = {}) {
+        if (!await ensureConnected()) return null;
+        return this.call(tool, { device_id: state.deviceId, ...extraArgs });
+    }
+};
+
+// ============ CONNECTION ============
+async function ensureConnected() {
+    if (state.deviceId) return true;
+    return autoConnect();
+}
+
+async function autoConnect() {
+    const btn = $('connectBtn');
+    btn?.classList.add('loading');
+
+    try {
+        const listResult = await api.call('list_devices', { only_booted: true });
+        if (!listResult.success || !listResult.result) return false;
+
+        const match = listResult.result.match(/UDID:\s*([A-F0-9-]+)/i);
+        if (!match) return false;
+
+        const bridgeResult = await api.call('start_bridge', { device_id: match[1] });
+        if (bridgeResult.success && bridgeResult.result?.includes('Session created')) {
+            state.deviceId = match[1];
+            fetchWindowSize();
+            await delay(300);
+            await api.call('get_screenshot', { device_id: state.deviceId });
+            return true;
+        }
+        return false;
+    } catch (e) {
+        console.error('Auto-connect failed:', e);
+        return false;
+    } finally {
+        btn?.classList.remove('loading');
+    }
+}
+
+async function fetchWindowSize() {
+    if (!state.deviceId) return;
+    const result = await api.call('get_window_size', { device_id: state.deviceId });
+    if (result.success) {
+        const match = result.result?.match(/(\d+)\s*x\s*(\d+)/);
+        if (match) state.windowSize = { width: +match[1], height: +match[2] };
+    }
+}
+
+// ============ WEBSOCKET ============
+function connectWS() {
+    const protocol = location.protocol === 'https:' ? 'wss:' : 'ws:';
+    state.ws = new WebSocket(`${protocol}//${location.host}/ws`);
+    state.ws.binaryType = 'arraybuffer';
+
+    state.ws.onopen = () => {
+        $('statusIndicator').classList.add('connected');
+        $('connectionText').textContent = 'Connected';
+        state.reconnectAttempts = 0;
+    };
+
+    state.ws.onclose = () => {
+        $('statusIndicator').classList.remove('connected');
+        $('connectionText').textContent = 'Reconnecting';
+        setTimeout(connectWS, Math.min(1000 * 2 ** state.reconnectAttempts++, 30000));
+    };
+
+    // Server sends pre-encoded binary frames; decode before parsing
+    state.ws.onmessage = e => {
+        const text = typeof e.data === 'string' ? e.data : new TextDecoder().decode(e.data);
+        handleMessage(JSON.parse(text));
+    };
+}
+
+function handleMessage(msg) {
+    if (msg.type === 'batch') {
+        msg.events.forEach(handleMessage);
+        return;
+    }
+    const handlers = {
+        init: d => {
+            state.toolCalls = (d.tool_calls || []).reverse();
+            state.callsById = new Map(state.toolCalls.map(c => [c.id, c]));
+            state.uptimeSeconds = d.uptime || 0;
+            if (d.device_info?.udid) state.deviceId = d.device_info.udid;
+            renderToolCalls();
+            updateStats();
+            updateDeviceInfo(d.device_info);
+            updateRecordingUI(d.recording_active);
+            if (d.last_screenshot) {
+                updateScreenshot(d.screenshot_version || 0);
+            } else if (state.deviceId) {
+                // Take a fresh screenshot if device connected but no cached screenshot
+                delay(300).then(() => api.call('get_screenshot', { device_id: state.deviceId }));
+            } else {
+                setTimeout(autoConnect, 500);
+            }
+        },
+        tool_call: d => {
+            state.toolCalls.unshift(d);
+            state.callsById.set(d.id, d);
+            upsertToolCall(d, true);
+            if (state.toolCalls.length > 100) {
+                const removed = state.toolCalls.pop();
+                state.callsById.delete(removed.id);
+                const el = callEls.get(removed.id);
+                if (el) { el.remove(); callEls.delete(removed.id); }
+            }
+            $('callCount').textContent = state.toolCalls.length;
+        },
+        tool_complete: d => {
+            // Deltas carry only changed fields; merge into the record
+            const existing = state.callsById.get(d.id);
+            const call = existing ? Object.assign(existing, d) : d;
+            if (existing) upsertToolCall(call);
+            updateStats();
+        },
+        screenshot: d => updateScreenshot(d.version),
+        device_info: d => {
+            updateDeviceInfo(d);
+            if (d?.udid) state.deviceId = d.udid;
+        }
+    };
+    handlers[msg.type]?.(msg.data);
+}
+
+// ============ RENDERING ============
+// id -> element map enables per-row updates; the list is only fully
+// rebuilt on init/clear, not on every event
+const callEls = new Map();
+
+function escapeHtml(s) {
+    return String(s).replace(/[&<>"']/g, ch => (
+        { '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;' }[ch]
+    ));
+}
+
+function toolItemInner(c) {
+    return `
+        <div class="tool-header">
+            <span class="tool-name">${escapeHtml(c.tool_name)}</span>
+            <div class="tool-meta">
+                ${c.duration_ms ? `<span class="tool-duration">${c.duration_ms.toFixed(0)}ms</span>` : ''}
+                <span>${c.time_str}</span>
+            </div>
+        </div>
+        <div class="tool-args">${escapeHtml(formatArgs(c.arguments))}</div>`;
+}
+
+function upsertToolCall(c, prepend = false) {
+    const container = $('toolCalls');
+    let el = callEls.get(c.id);
+    if (!el) {
+        if (!callEls.size) container.innerHTML = '';
+        el = document.createElement('div');
+        el.onclick = () => openModalById(c.id);
+        prepend ? container.prepend(el) : container.append(el);
+        callEls.set(c.id, el);
+    }
+    el.className = `tool-item ${c.status}`;
+    el.innerHTML = toolItemInner(c);
+}
+
+function renderToolCalls() {
+    $('callCount').textContent = state.toolCalls.length;
+    const container = $('toolCalls');
+    callEls.clear();
+
+    if (!state.toolCalls.length) {
+        container.innerHTML = '<div class="empty-state"><span class="material-symbols-outlined">terminal</span><span>Waiting for tool calls</span></div>';
+        return;
+    }
+
+    container.innerHTML = '';
+    state.toolCalls.forEach(c => upsertToolCall(c));
+}
+
+function formatArgs(args) {
+    if (!args || !Object.keys(args).length) return '(no arguments)';
+    return Object.entries(args).map(([k, v]) => {
+        const val = typeof v === 'object' ? JSON.stringify(v) : v;
+        return `${k}: ${String(val).slice(0, 40)}${String(val).length > 40 ? '...' : ''}`;
+    }).join('\n');
+}
+
+function updateStats() {
+    const completed = state.toolCalls.filter(c => c.status !== 'pending');
+    const success = completed.filter(c => c.status === 'success');
+
+    $('totalCalls').textContent = state.toolCalls.length;
+    if (completed.length) {
+        $('successRate').textContent = `${(success.length / completed.length * 100).toFixed(0)}%`;
+        const durations = completed.filter(c => c.duration_ms).map(c => c.duration_ms);
+        if (durations.length) {
+            const avg = durations.reduce((a, b) => a + b, 0) / durations.length;
+            $('avgDuration').textContent = avg < 1000 ? `${avg.toFixed(0)}ms` : `${(avg/1000).toFixed(1)}s`;
+        }
+    }
+}
+
+function updateDeviceInfo(info) {
+    const el = $('deviceInfo');
+    if (!info || !Object.keys(info).length) {
+        el.innerHTML = '<span class="info-item"><span class="info-value">Not connected</span></span>';
+        return;
+    }
+    el.innerHTML = `
+        <span class="info-item"><span class="info-value">${info.name || '—'}</span></span>
+        <span class="info-item"><span class="info-label">iOS</span> <span class="info-value">${info.ios_version || '—'}</span></span>
+        <span class="info-item"><span class="info-value ${info.wda_connected ? 'online' : ''}">${info.wda_connected ? 'Connected' : '—'}</span></span>
+    `;
+}
+
+function updateScreenshot(version) {
+    // Version-keyed src: the browser only refetches when the frame changed
+    if (version === state.screenshotVersion) return;
+    state.screenshotVersion = version;
+    $('deviceScreen').innerHTML = `<img src="/screenshot?v=${version}" alt="Screenshot" onerror="this.parentElement.innerHTML='<span class=\'no-preview\'>No preview</span>'">`;
+    $('screenshotTime').textContent = new Date().toLocaleTimeString();
+}
+
+function formatUptime(s) {
+    if (s < 60) return `${Math.floor(s)}s`;
+    if (s < 3600) return `${Math.floor(s / 60)}m`;
+    return `${Math.floor(s / 3600)}h ${Math.floor((s % 3600) / 60)}m`;
+}
+
+// ============ ACTIONS ============
+const UI_ACTIONS = ['swipe', 'go_home', 'press_button', 'double_tap', 'long_press'];
+
+async function quickAction(tool, extraArgs = {}) {
+    if (!await ensureConnected()) return;
+
+    const btn = event?.target?.closest('.action-btn, .swipe-btn');
+    btn?.classList.add('loading');
+
+    try {
+        const result = await api.call(tool, { device_id: state.deviceId, ...extraArgs });
+        if (!result.success) console.error('Action failed:', result.error);
+        recordAction(tool, extraArgs);
+
+        // Take screenshot after UI-affecting actions
+        if (UI_ACTIONS.includes(tool)) {
+            await delay(300);
+            await api.call('get_screenshot', { device_id: state.deviceId });
+        }
+    } catch (e) {
+        console.error('Action error:', e);
+    } finally {
+        btn?.classList.remove('loading');
+    }
+}
+
+async function toggleRecording() {
+    if (!await ensureConnected()) return;
+    const tool = state.isRecording ? 'stop_recording' : 'start_recording';
+    const btn = $('recordBtn');
+    btn?.classList.add('loading');
+
+    try {
+        const result = await api.call(tool, { device_id: state.deviceId });
+        if (result.success) {
+            state.isRecording = !state.isRecording;
+            updateRecordingUI(state.isRecording);
+        }
+    } finally {
+        btn?.classList.remove('loading');
+    }
+}
+
+function updateRecordingUI(active) {
+    state.isRecording = active;
+    const btn = $('recordBtn');
+    const indicator = $('recIndicator');
+
+    if (active) {
+        btn.innerHTML = '<span class="material-symbols-outlined">stop_circle</span><span>Stop</span>';
+        btn.style.cssText = 'background:var(--error);color:white';
+        indicator.style.display = 'flex';
+    } else {
+        btn.innerHTML = '<span class="material-symbols-outlined">videocam</span><span>Record</span>';
+        btn.style.cssText = '';
+        indicator.style.display = 'none';
+    }
+}
+
+// ============ SCREENSHOT INTERACTION ============
+function setInteractionMode(mode) {
+    state.interactionMode = mode;
+    $('modeTap').classList.toggle('active', mode === 'tap');
+    $('modeDownload').classList.toggle('active', mode === 'download');
+    $('deviceScreen').style.cursor = mode === 'tap' ? 'crosshair' : 'pointer';
+}
+
+function getDeviceCoords(e) {
+    const img = document.querySelector('#deviceScreen img');
+    if (!img) return null;
+    const rect = img.getBoundingClientRect();
+    const scaleX = state.windowSize.width / rect.width;
+    const scaleY = state.windowSize.height / rect.height;
+    return {
+        x: Math.max(0, Math.min(Math.round((e.clientX - rect.left) * scaleX), state.windowSize.width)),
+        y: Math.max(0, Math.min(Math.round((e.clientY - rect.top) * scaleY), state.windowSize.height))
+    };
+}
+
+function handleScreenMouseMove(e) {
+    const coords = getDeviceCoords(e);
+    if (!coords) return;
+    const tooltip = $('coordTooltip');
+    const rect = $('screenshotContainer').getBoundingClientRect();
+    tooltip.textContent = `x: ${coords.x}, y: ${coords.y}`;
+    tooltip.style.left = (e.clientX - rect.left + 12) + 'px';
+    tooltip.style.top = (e.clientY - rect.top - 24) + 'px';
+    tooltip.classList.add('visible');
+}
+
+function hideCoordTooltip() { $('coordTooltip').classList.remove('visible'); }
+
+async function handleScreenClick(e) {
+    if (state.interactionMode === 'download') return downloadScreenshot();
+
+    const coords = getDeviceCoords(e);
+    if (!coords || !await ensureConnected()) return;
+
+    showTapFeedback(e);
+    recordAction('tap', { x: coords.x, y: coords.y });
+    await api.call('tap', { device_id: state.deviceId, ...coords });
+    await delay(200);
+    await api.call('get_screenshot', { device_id: state.deviceId });
+}
+
+function showTapFeedback(e) {
+    const rect = $('screenshotContainer').getBoundingClientRect();
+    const fb = document.createElement('div');
+    fb.className = 'tap-feedback';
+    fb.style.left = (e.clientX - rect.left) + 'px';
+    fb.style.top = (e.clientY - rect.top) + 'px';
+    $('screenshotContainer').appendChild(fb);
+    setTimeout(() => fb.remove(), 400);
+}
+
+function downloadScreenshot() {
+    const link = document.createElement('a');
+    link.href = '/screenshot?v=' + state.screenshotVersion;
+    link.download = 'screenshot-' + new Date().toISOString().slice(0, 19).replace(/[T:]/g, '-') + '.jpg';
+    link.click();
+}
+
+// ============ TEXT & APP ============
+function handleTextInputKey(e) { if (e.key === 'Enter') sendText(); }
+
+async function sendText() {
+    const input = $('textInput');
+    const text = input.value.trim();
+    if (!text || !await ensureConnected()) return;
+
+    recordAction('type_text', { text });
+    await api.call('type_text', { device_id: state.deviceId, text });
+    input.value = '';
+    await delay(200);
+    await api.call('get_screenshot', { device_id: state.deviceId });
+}
+
+async function launchSelectedApp() {
+    const select = $('appSelect');
+    const bundleId = select.value;
+    if (!bundleId || !await ensureConnected()) { select.value = ''; return; }
+
+    recordAction('launch_app', { bundle_id: bundleId });
+    await api.call('launch_app', { device_id: state.deviceId, bundle_id: bundleId });
+    select.value = '';
+    await delay(500);
+    await api.call('get_screenshot', { device_id: state.deviceId });
+}
+
+// ============ MODAL ============
+function openModalById(id) {
+    const c = state.callsById.get(id);
+    if (!c) return;
+
+    $('modalToolName').textContent = c.tool_name;
+    $('modalStatus').textContent = c.status;
+    $('modalStatus').className = 'modal-status ' + c.status;
+    $('modalTime').textContent = c.time_str;
+    $('modalDuration').textContent = c.duration_ms ? c.duration_ms.toFixed(0) + 'ms' : '—';
+    $('modalArgs').textContent = JSON.stringify(c.arguments || {}, null, 2);
+
+    $('modalResultSection').style.display = c.result ? 'block' : 'none';
+    $('modalResult').textContent = c.result || '';
+    $('modalErrorSection').style.display = c.error ? 'block' : 'none';
+    $('modalError').textContent = c.error || '';
+
+    $('modalOverlay').classList.add('open');
+    document.body.style.overflow = 'hidden';
+}
+
+function closeModal(e) {
+    if (e && e.target !== e.currentTarget) return;
+    $('modalOverlay').classList.remove('open');
+    document.body.style.overflow = '';
+}
+
+function copyContent(id) {
+    navigator.clipboard.writeText($(id).textContent).then(() => {
+        const btn = $(id).parentElement.querySelector('.copy-btn');
+        if (btn) {
+            btn.classList.add('copied');
+            btn.innerHTML = '<span class="material-symbols-outlined" style="font-size:14px">check</span> Copied';
+            setTimeout(() => {
+                btn.classList.remove('copied');
+                btn.innerHTML = '<span class="material-symbols-outlined" style="font-size:14px">content_copy</span> Copy';
+            }, 2000);
+        }
+    });
+}
+
+// ============ AUTO-REFRESH ============
+let autoRefreshInterval = null;
+
+function toggleAutoRefresh() {
+    if ($('autoRefresh').checked) {
+        autoRefreshInterval = setInterval(() => state.deviceId && quickAction('get_screenshot'), 3000);
+    } else {
+        clearInterval(autoRefreshInterval);
+        autoRefreshInterval = null;
+    }
+}
+
+function clearHistory() {
+    state.toolCalls = [];
+    state.callsById.clear();
+    renderToolCalls();
+    updateStats();
+}
+
+// ============ SEQUENCES ============
+function saveSequences() { localStorage.setItem('ios-mcp-sequences', JSON.stringify(state.sequences)); }
+
+function renderSequences() {
+    const list = $('sequenceList');
+    if (!state.sequences.length) {
+        list.innerHTML = '<div class="seq-empty">No saved sequences</div>';
+        return;
+    }
+    list.innerHTML = state.sequences.map((s, i) => `
+        <div class="sequence-item">
+            <span class="seq-name" title="${s.name}">${s.name}</span>
+            <span class="seq-count">${s.actions.length}</span>
+            <button class="seq-icon-btn play" onclick="playSequence(${i})"><span class="material-symbols-outlined">play_arrow</span></button>
+            <button class="seq-icon-btn delete" onclick="deleteSequence(${i})"><span class="material-symbols-outlined">close</span></button>
+        </div>
+    `).join('');
+}
+
+function toggleSequenceRecording() {
+    state.seqRecording.active ? stopSequenceRecording() : startSequenceRecording();
+}
+
+function startSequenceRecording() {
+    state.seqRecording = { active: true, actions: [] };
+    $('seqRecordBtn').classList.add('recording');
+    $('seqRecordText').textContent = 'Stop';
+    $('seqRecordingIndicator').style.display = 'flex';
+    $('seqActionCount').textContent = '0';
+}
+
+function stopSequenceRecording() {
+    $('seqRecordBtn').classList.remove('recording');
+    $('seqRecordText').textContent = 'Rec';
+    $('seqRecordingIndicator').style.display = 'none';
+
+    if (state.seqRecording.actions.length) {
+        const name = prompt('Name this sequence:', `Sequence ${state.sequences.length + 1}`);
+        if (name) {
+            state.sequences.push({ name, actions: state.seqRecording.actions, created: Date.now() });
+            saveSequences();
+            renderSequences();
+        }
+    }
+    state.seqRecording = { active: false, actions: [] };
+}
+
+function recordAction(tool, args) {
+    if (!state.seqRecording.active) return;
+    const RECORDABLE = ['tap', 'type_text', 'swipe', 'go_home', 'launch_app', 'press_button'];
+    if (!RECORDABLE.includes(tool)) return;
+
+    const cleanArgs = { ...args };
+    delete cleanArgs.device_id;
+    state.seqRecording.actions.push({ tool, args: cleanArgs });
+    $('seqActionCount').textContent = state.seqRecording.actions.length;
+}
+
+async function playSequence(idx) {
+    const seq = state.sequences[idx];
+    if (!seq?.actions.length || !await ensureConnected()) return;
+
+    $$('.seq-icon-btn.play').forEach(b => b.disabled = true);
+    try {
+        for (const a of seq.actions) {
+            await api.call(a.tool, { device_id: state.deviceId, ...a.args });
+            await delay(300);
+        }
+        await delay(200);
+        await api.call('get_screenshot', { device_id: state.deviceId });
+    } finally {
+        $$('.seq-icon-btn.play').forEach(b => b.disabled = false);
+    }
+}
+
+function deleteSequence(idx) {
+    if (confirm('Delete this sequence?')) {
+        state.sequences.splice(idx, 1);
+        saveSequences();
+        renderSequences();
+    }
+}
+
+// ============ KEYBOARD SHORTCUTS ============
+document.addEventListener('keydown', e => {
+    if (['INPUT', 'TEXTAREA', 'SELECT'].includes(e.target.tagName)) {
+        if (e.key === 'Escape') e.target.blur();
+        return;
+    }
+    if (e.key === 'Escape') return closeModal();
+
+    const shortcuts = { s: () => quickAction('get_screenshot'), h: () => quickAction('go_home'), r: toggleRecording, t: () => $('textInput').focus(), u: () => quickAction('get_ui_tree') };
+    const fn = shortcuts[e.key.toLowerCase()];
+    if (fn) { e.preventDefault(); fn(); }
+});
+
+// ============ INIT ============
+setInterval(() => $('uptime').textContent = formatUptime(++state.uptimeSeconds), 1000);
+setInteractionMode('tap');
+renderSequences();
+connectWS();
@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from mobile_pilot_mcp import server as server_module
+
+
+async def _load_registry() -> tuple[Any, Any]:
+    tools = await server_module.mcp.get_tools()
+    resources = await server_module.mcp.get_resources()
+    return tools, resources
+
+
+@pytest.fixture(scope="session")
+def mcp_registry() -> dict[str, Any]:
+    """FastMCP tool/resource registries, loaded once per test session.
+
+    Normalizes the dict vs list return shapes across FastMCP versions so
+    tests can assert against plain name->tool / key sets.
+    """
+    tools, resources = asyncio.run(_load_registry())
+    tool_map = tools if isinstance(tools, dict) else {tool.name: tool for tool in tools}
+    resource_keys = (
+        set(resources.keys())
+        if isinstance(resources, dict)
+        else {resource.key for resource in resources}
+    )
+    return {"tools": tool_map, "resource_keys": resource_keys}
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import asyncio
+import json
+
+from mobile_pilot_mcp.dashboard import DashboardState
+
+
+class FakeWebSocket:
+    """Collects broadcast payloads like an aiohttp WebSocketResponse."""
+
+    def __init__(self) -> None:
+        self.payloads: list[bytes] = []
+
+    async def send_bytes(self, data: bytes) -> None:
+        self.payloads.append(data)
+
+
+async def _drain(state: DashboardState) -> None:
+    """Let the broadcaster task absorb, flush, and the writers send."""
+    await asyncio.sleep(0.05)
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+async def test_tool_call_broadcast_reaches_clients() -> None:
+    state = DashboardState()
+    ws = FakeWebSocket()
+    state.register_client(ws)
+
+    state.add_tool_call("tap", {"x": 10, "y": 20})
+    await _drain(state)
+
+    assert ws.payloads
+    message = json.loads(ws.payloads[-1])
+    assert message["type"] == "tool_call"
+    assert message["data"]["tool_name"] == "tap"
+
+
+def test_screenshot_path_extracted_from_result() -> None:
+    state = DashboardState()
+    call = state.add_tool_call("get_screenshot", {})
+    state.complete_tool_call(
+        call,
+        result="Screenshot saved: /tmp/shot.jpg\nSize: 585x1266\nFormat: JPEG",
+    )
+    assert state.last_screenshot == "/tmp/shot.jpg"
+
+
+def test_tool_call_history_is_bounded() -> None:
+    state = DashboardState(max_calls=5)
+    for i in range(8):
+        state.add_tool_call("tap", {"n": i})
+
+    assert len(state.tool_calls) == 5
+    assert state.tool_calls[0].arguments == {"n": 3}
+    assert state.call_counter == 8
+
+
+async def test_rapid_status_updates_are_conflated() -> None:
+    state = DashboardState()
+    ws = FakeWebSocket()
+    state.register_client(ws)
+
+    state.update_wda_status({"ready": False})
+    state.update_wda_status({"ready": True})
+    await _drain(state)
+
+    assert len(ws.payloads) == 1
+    message = json.loads(ws.payloads[0])
+    assert message["type"] == "wda_status"
+    assert message["data"] == {"ready": True}
+
+
+async def test_burst_of_events_is_batched_into_one_frame() -> None:
+    state = DashboardState()
+    ws = FakeWebSocket()
+    state.register_client(ws)
+
+    call = state.add_tool_call("tap", {"x": 1, "y": 2})
+    state.complete_tool_call(call, result="ok")
+    await _drain(state)
+
+    assert len(ws.payloads) == 1
+    message = json.loads(ws.payloads[0])
+    assert message["type"] == "batch"
+    assert [e["type"] for e in message["events"]] == ["tool_call", "tool_complete"]
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-import asyncio
+from typing import Any
 
 from mobile_pilot_mcp import server as server_module
 
@@ -10,13 +10,7 @@ def test_server_compat_export_points_to_mcp() -> None:
     assert server_module.server is server_module.mcp
 
 
-def test_fastmcp_tools_registered() -> None:
-    tools = asyncio.run(server_module.mcp.get_tools())
-    if isinstance(tools, dict):
-        tool_names = set(tools.keys())
-    else:
-        tool_names = {tool.name for tool in tools}
-
+def test_fastmcp_tools_registered(mcp_registry: dict[str, Any]) -> None:
     expected_tools = {
         "list_devices",
         "start_bridge",
@@ -24,19 +18,13 @@ def test_fastmcp_tools_registered() -> None:
         "tap",
         "discover_dtd_uris",
     }
-    assert expected_tools.issubset(tool_names)
+    assert expected_tools.issubset(mcp_registry["tools"].keys())
 
-    start_bridge_tool = asyncio.run(server_module.mcp.get_tool("start_bridge"))
+    start_bridge_tool = mcp_registry["tools"]["start_bridge"]
     assert start_bridge_tool.name == "start_bridge"
     assert start_bridge_tool.description
 
 
-def test_fastmcp_resources_registered() -> None:
-    resources = asyncio.run(server_module.mcp.get_resources())
-    if isinstance(resources, dict):
-        resource_keys = set(resources.keys())
-    else:
-        resource_keys = {resource.key for resource in resources}
-
-    assert "mobile-pilot://api-reference" in resource_keys
-    assert "mobile-pilot://automation-guide" in resource_keys
+def test_fastmcp_resources_registered(mcp_registry: dict[str, Any]) -> None:
+    assert "mobile-pilot://api-reference" in mcp_registry["resource_keys"]
+    assert "mobile-pilot://automation-guide" in mcp_registry["resource_keys"]